@@ -15,6 +15,8 @@ Configuration is done via environment variables (set by Makefile):
 import os
 import sys
 import csv
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
 
 import numpy as np
 
@@ -22,7 +24,7 @@ import numpy as np
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from search_algorithms import (
-    bfs_search, dfs_search, gbfs_search, astar_search,
+    bfs_search, bibfs_search, dfs_search, gbfs_search, astar_search,
     generate_maze, FALLBACK_MAZE
 )
 from visualization import draw_comparison, save_maze_image, animate_search
@@ -39,36 +41,57 @@ _seed = os.environ.get('RANDOM_SEED', '')
 RANDOM_SEED = int(_seed) if _seed else None
 
 
-def run_all_algorithms(grid, start, goal):
+def run_all_algorithms(grid, start, goal, snapshots=False):
     """
     Run all search algorithms on the given maze.
-    
+
     Args:
         grid: 2D numpy array (0=free, 1=wall)
         start: Start cell (row, col)
         goal: Goal cell (row, col)
-        
+        snapshots: Record frontier deltas for animations (only needed
+                   when SAVE_ANIMATIONS is on)
+
     Returns:
         Dict of {algorithm_name: SearchResult}
     """
     algorithms = {
         'BFS': bfs_search,
+        'BiBFS': bibfs_search,
         'DFS': dfs_search,
         'GBFS': gbfs_search,
         'A*': astar_search
     }
-    
+
     results = {}
-    
+
     print("\n" + "=" * 60)
     print("RUNNING SEARCH ALGORITHMS")
     print("=" * 60)
-    
-    for name, search_func in algorithms.items():
-        print(f"\nRunning {name}...")
-        result = search_func(grid, start, goal)
-        results[name] = result
-        
+
+    # The four searches are pure functions of (grid, start, goal), so
+    # they can run in separate processes; the grid is small enough that
+    # pickling it per worker is negligible.
+    cpu_count = os.cpu_count() or 1
+    if cpu_count >= 2:
+        with ProcessPoolExecutor(max_workers=min(4, cpu_count)) as executor:
+            futures = {
+                executor.submit(search_func, grid, start, goal,
+                                snapshot_mode=snapshots): name
+                for name, search_func in algorithms.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    else:
+        for name, search_func in algorithms.items():
+            results[name] = search_func(grid, start, goal,
+                                        snapshot_mode=snapshots)
+
+    # Report in the declared algorithm order regardless of completion
+    for name in algorithms:
+        result = results[name]
+        print(f"\n{name}:")
+
         if result.success:
             print(f"  ✓ Path found!")
             print(f"    - Path length: {result.path_length}")
@@ -77,8 +100,9 @@ def run_all_algorithms(grid, start, goal):
         else:
             print(f"  ✗ No path found")
             print(f"    - Cells explored: {result.explored_count}")
-    
-    return results
+
+    # Preserve the declared order for downstream tables/plots
+    return {name: results[name] for name in algorithms}
 
 
 def print_comparison_table(results):
@@ -112,25 +136,44 @@ def print_comparison_table(results):
     print("      DFS and GBFS do not guarantee optimal paths.")
 
 
+def _write_path_file(name, result, output_dir):
+    """Write one algorithm's path report; returns the filename."""
+    filename = os.path.join(output_dir, f"{name.lower().replace('*', 'star')}_path.txt")
+    with open(filename, 'w') as f:
+        f.write(f"Algorithm: {name}\n")
+        f.write(f"Path Length: {result.path_length}\n")
+        f.write(f"Cells Explored: {result.explored_count}\n")
+        f.write(f"Execution Time: {result.execution_time * 1000:.2f} ms\n")
+        f.write(f"\nPath:\n")
+        for cell in result.path:
+            f.write(f"  {cell}\n")
+    return filename
+
+
+def _save_animation_gif(job):
+    """Render and save one animation GIF (runs in a worker process)."""
+    grid, start, goal, result, name, filename = job
+    animate_search(grid, start, goal, result, name,
+                   filename=filename, interval=100)
+    return filename
+
+
 def save_results(results, output_dir, grid, start, goal):
     """Save results to files."""
     os.makedirs(output_dir, exist_ok=True)
     os.makedirs(os.path.join(output_dir, 'animations'), exist_ok=True)
-    
-    # Save paths to text files
-    for name, result in results.items():
-        if result.success:
-            filename = os.path.join(output_dir, f"{name.lower().replace('*', 'star')}_path.txt")
-            with open(filename, 'w') as f:
-                f.write(f"Algorithm: {name}\n")
-                f.write(f"Path Length: {result.path_length}\n")
-                f.write(f"Cells Explored: {result.explored_count}\n")
-                f.write(f"Execution Time: {result.execution_time * 1000:.2f} ms\n")
-                f.write(f"\nPath:\n")
-                for cell in result.path:
-                    f.write(f"  {cell}\n")
-            print(f"Saved: {filename}")
-    
+
+    # Save paths to text files - independent I/O-bound writes, so a
+    # small thread pool overlaps them
+    successful = [(name, result) for name, result in results.items()
+                  if result.success]
+    if successful:
+        with ThreadPoolExecutor(max_workers=min(4, len(successful))) as pool:
+            futures = [pool.submit(_write_path_file, name, result, output_dir)
+                       for name, result in successful]
+            for future in futures:
+                print(f"Saved: {future.result()}")
+
     # Save performance metrics to CSV
     csv_filename = os.path.join(output_dir, 'performance_metrics.csv')
     with open(csv_filename, 'w', newline='') as f:
@@ -163,13 +206,22 @@ def save_animations(results, output_dir, grid, start, goal):
     print("SAVING ANIMATIONS")
     print("=" * 60)
     
+    # GIF rendering is CPU-bound matplotlib work with non-thread-safe
+    # state, so each animation renders in its own process
+    jobs = []
     for name, result in results.items():
         if result.success:
             safe_name = name.lower().replace('*', 'star')
             filename = os.path.join(animations_dir, f"{safe_name}_animation.gif")
-            print(f"\nGenerating {name} animation...")
-            animate_search(grid, start, goal, result, name, 
-                          filename=filename, interval=100)
+            print(f"Queueing {name} animation...")
+            jobs.append((grid, start, goal, result, name, filename))
+
+    if jobs:
+        # The workers print their own Saving/Saved lines; draining the
+        # iterator here just surfaces any worker exception
+        with ProcessPoolExecutor(max_workers=min(4, len(jobs))) as pool:
+            for _ in pool.map(_save_animation_gif, jobs):
+                pass
 
 
 def print_maze(grid, start, goal):
@@ -197,10 +249,10 @@ def print_maze(grid, start, goal):
 
 def main():
     """Main entry point."""
-    # Set random seed if provided
-    if RANDOM_SEED is not None:
-        np.random.seed(RANDOM_SEED)
-    
+    # Single Generator for the whole run; seeded when RANDOM_SEED is set
+    # (default_rng(None) pulls fresh OS entropy)
+    rng = np.random.default_rng(RANDOM_SEED)
+
     print("=" * 60)
     print("ROBOT MAZE PATH PLANNING - AI SEARCH ALGORITHMS")
     print("=" * 60)
@@ -213,7 +265,7 @@ def main():
     else:
         rows, cols = ROWS, COLS
         print(f"\nGenerating {rows}x{cols} maze (wall probability: {WALL_PROB})...")
-        grid = generate_maze(rows, cols, wall_prob=WALL_PROB)
+        grid = generate_maze(rows, cols, wall_prob=WALL_PROB, rng=rng)
     
     # Define start and goal
     start = (0, 0)
@@ -226,8 +278,9 @@ def main():
     # Print ASCII maze
     print_maze(grid, start, goal)
     
-    # Run all algorithms
-    results = run_all_algorithms(grid, start, goal)
+    # Run all algorithms (frontier snapshots only when animating)
+    results = run_all_algorithms(grid, start, goal,
+                                 snapshots=SAVE_ANIMATIONS)
     
     # Print comparison
     print_comparison_table(results)
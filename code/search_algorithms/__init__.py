@@ -4,6 +4,7 @@ Search algorithms module for maze path planning.
 
 from .utils import SearchResult, TrackingMixin, GridSearchBase, TrackedGridSearch
 from .bfs import BFS, bfs_search
+from .bibfs import BiBFS, bibfs_search
 from .dfs import DFS, dfs_search
 from .astar import AStar, astar_search
 from .gbfs import GBFS, gbfs_search
@@ -18,6 +19,9 @@ __all__ = [
     # BFS
     'BFS',
     'bfs_search',
+    # Bidirectional BFS
+    'BiBFS',
+    'bibfs_search',
     # DFS
     'DFS',
     'dfs_search',
@@ -0,0 +1,149 @@
+"""
+Numba-compiled A* kernel.
+
+Fuses the whole A* expansion step - neighbor index, wall check, visited
+check, g+h computation, heap push - into one nopython function over
+flat NumPy arrays, mirroring _bfs_numba.py:
+
+- Cells are encoded as a single int32 index (idx = r * cols + c).
+- The open list is a binary heap over parallel key/value arrays with
+  int64 packed keys ((f << 32) | counter), the same layout as
+  utils.IntHeap but living entirely inside the kernel.
+- g-cost, parent, and visited state are flat arrays, no dicts or sets.
+
+The kernel hard-codes the Manhattan heuristic; custom heuristics and
+priority overrides (GBFS) stay on the Python path.
+
+This module is only imported when numba is installed; callers fall back
+to the pure-Python loop otherwise (see astar.py).
+"""
+
+import numpy as np
+from numba import njit
+
+# Neighbor offsets: right, left, down, up (same order as
+# GridSearchBase.directions). Module globals are compile-time constants
+# for the kernel.
+_DR = np.array([0, 0, 1, -1], dtype=np.int32)
+_DC = np.array([1, -1, 0, 0], dtype=np.int32)
+
+
+@njit(cache=True)
+def astar_core(grid, sr, sc, gr, gc):
+    """
+    Run A* with the Manhattan heuristic on a flat uint8 grid.
+
+    Args:
+        grid: 2D uint8 array (C-contiguous, 0 = free, 1 = wall)
+        sr, sc: Start cell (row, col)
+        gr, gc: Goal cell (row, col)
+
+    Returns:
+        (parent, visited_order, success) in the same format as
+        _bfs_numba.bfs_core: parent maps cell index -> predecessor
+        index (start points to itself, -1 = unvisited by the search
+        tree), visited_order lists explored cell indices in order, and
+        success reports whether the goal was reached.
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+
+    g_cost = np.full(n, np.iinfo(np.int32).max, dtype=np.int32)
+    parent = np.full(n, -1, dtype=np.int32)
+    visited = np.zeros(n, dtype=np.uint8)
+    visited_order = np.empty(n, dtype=np.int32)
+
+    heap_keys = np.empty(n, dtype=np.int64)
+    heap_vals = np.empty(n, dtype=np.int32)
+    size = 0
+    counter = 0
+
+    start = sr * cols + sc
+    goal = gr * cols + gc
+
+    g_cost[start] = 0
+    parent[start] = start
+    h0 = abs(sr - gr) + abs(sc - gc)
+    heap_keys[0] = np.int64(h0) << 32
+    heap_vals[0] = start
+    size = 1
+
+    n_visited = 0
+    success = False
+
+    while size > 0:
+        # Pop the cell with the smallest packed (f, counter) key
+        idx = heap_vals[0]
+        size -= 1
+        if size > 0:
+            key = heap_keys[size]
+            val = heap_vals[size]
+            pos = 0
+            child = 1
+            while child < size:
+                if child + 1 < size and heap_keys[child + 1] < heap_keys[child]:
+                    child += 1
+                if heap_keys[child] >= key:
+                    break
+                heap_keys[pos] = heap_keys[child]
+                heap_vals[pos] = heap_vals[child]
+                pos = child
+                child = 2 * pos + 1
+            heap_keys[pos] = key
+            heap_vals[pos] = val
+
+        # Stale entry: already expanded with a lower cost
+        if visited[idx] != 0:
+            continue
+
+        visited[idx] = 1
+        visited_order[n_visited] = idx
+        n_visited += 1
+
+        if idx == goal:
+            success = True
+            break
+
+        r = idx // cols
+        c = idx % cols
+        new_g = g_cost[idx] + 1
+
+        for k in range(4):
+            nr = r + _DR[k]
+            nc = c + _DC[k]
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols:
+                continue
+            if grid[nr, nc] != 0:
+                continue
+            nidx = nr * cols + nc
+            if visited[nidx] != 0 or new_g >= g_cost[nidx]:
+                continue
+
+            g_cost[nidx] = new_g
+            parent[nidx] = idx
+            f = new_g + abs(nr - gr) + abs(nc - gc)
+            counter += 1
+
+            # Push (f, counter) -> nidx, growing the heap if needed
+            if size == heap_keys.shape[0]:
+                grown_keys = np.empty(size * 2, dtype=np.int64)
+                grown_keys[:size] = heap_keys
+                heap_keys = grown_keys
+                grown_vals = np.empty(size * 2, dtype=np.int32)
+                grown_vals[:size] = heap_vals
+                heap_vals = grown_vals
+
+            key = (np.int64(f) << 32) | counter
+            pos = size
+            size += 1
+            while pos > 0:
+                par = (pos - 1) >> 1
+                if heap_keys[par] <= key:
+                    break
+                heap_keys[pos] = heap_keys[par]
+                heap_vals[pos] = heap_vals[par]
+                pos = par
+            heap_keys[pos] = key
+            heap_vals[pos] = nidx
+
+    return parent, visited_order[:n_visited], success
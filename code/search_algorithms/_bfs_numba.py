@@ -0,0 +1,91 @@
+"""
+Numba-compiled BFS kernel.
+
+The pure-Python BFS loop spends most of its time on interpreter overhead:
+bytecode dispatch, tuple construction, and tuple hashing in the visited
+set and parent dict. This module replaces all of that with a nopython
+kernel over flat NumPy arrays:
+
+- Cells are encoded as a single int32 index (idx = r * cols + c), so
+  membership tests and parent lookups become array indexing.
+- The queue is a preallocated int32 ring buffer with head/tail indices
+  (no deque, no per-push allocation).
+- The parent array doubles as the visited marker (-1 = unvisited).
+
+This module is only imported when numba is installed; callers fall back
+to the pure-Python loop otherwise (see bfs.py).
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def bfs_core(grid, sr, sc, gr, gc):
+    """
+    Run BFS on a flat uint8 grid (0 = free, 1 = wall).
+
+    Args:
+        grid: 2D uint8 array (C-contiguous)
+        sr, sc: Start cell (row, col)
+        gr, gc: Goal cell (row, col)
+
+    Returns:
+        (parent, visited_order, success) where parent is a flat int32
+        array mapping cell index -> predecessor index (the start cell
+        points to itself, -1 = unvisited), visited_order is an int32
+        array of cell indices in exploration order, and success is a
+        bool indicating whether the goal was reached.
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+
+    parent = np.full(n, -1, dtype=np.int32)
+    queue = np.empty(n, dtype=np.int32)
+    visited_order = np.empty(n, dtype=np.int32)
+
+    start = sr * cols + sc
+    goal = gr * cols + gc
+
+    head = 0
+    tail = 0
+    n_visited = 0
+
+    queue[tail] = start
+    tail += 1
+    parent[start] = start
+
+    success = False
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        visited_order[n_visited] = idx
+        n_visited += 1
+
+        if idx == goal:
+            success = True
+            break
+
+        r = idx // cols
+        c = idx % cols
+
+        # Neighbors unrolled: right, left, down, up (same order as
+        # GridSearchBase.directions).
+        if c + 1 < cols and grid[r, c + 1] == 0 and parent[idx + 1] == -1:
+            parent[idx + 1] = idx
+            queue[tail] = idx + 1
+            tail += 1
+        if c - 1 >= 0 and grid[r, c - 1] == 0 and parent[idx - 1] == -1:
+            parent[idx - 1] = idx
+            queue[tail] = idx - 1
+            tail += 1
+        if r + 1 < rows and grid[r + 1, c] == 0 and parent[idx + cols] == -1:
+            parent[idx + cols] = idx
+            queue[tail] = idx + cols
+            tail += 1
+        if r - 1 >= 0 and grid[r - 1, c] == 0 and parent[idx - cols] == -1:
+            parent[idx - cols] = idx
+            queue[tail] = idx - cols
+            tail += 1
+
+    return parent, visited_order[:n_visited], success
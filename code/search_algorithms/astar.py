@@ -1,5 +1,16 @@
 import heapq
-from .utils import TrackedGridSearch, SearchResult
+
+import numpy as np
+
+from .utils import TrackedGridSearch, SearchResult, IntHeap
+
+# The compiled kernel needs numba, which is an optional accelerator.
+# Without it we simply keep using the pure-Python loop.
+try:
+    from ._astar_numba import astar_core
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
 
 class AStar(TrackedGridSearch):
@@ -26,15 +37,17 @@ class AStar(TrackedGridSearch):
     - GREY: Final path
     """
     
-    def __init__(self, grid, heuristic=None):
+    def __init__(self, grid, heuristic=None, track=True, snapshot_mode=False):
         """
         Initialize A*.
-        
+
         Args:
             grid: 2D grid (0 = free, 1 = wall)
             heuristic: Function(cell, goal) -> cost. Defaults to Manhattan distance.
+            track: Record visited order for visualization
+            snapshot_mode: Also record frontier deltas (needed to animate)
         """
-        super().__init__(grid)
+        super().__init__(grid, track=track, snapshot_mode=snapshot_mode)
         self.heuristic = heuristic or self.manhattan_distance
     
     @staticmethod
@@ -67,78 +80,249 @@ class AStar(TrackedGridSearch):
         """
         # Reset tracking for new search
         self.init_tracking()
+
+        # Fast path: with tracking off, the default priority function,
+        # and the default Manhattan heuristic, the whole search can run
+        # inside the compiled kernel.
+        if (not self.track and _HAS_NUMBA
+                and type(self).calculate_priority is AStar.calculate_priority
+                and self.heuristic is AStar.manhattan_distance):
+            return self._search_compiled(start, goal)
+
+        # Custom heuristics may return floats (e.g. Euclidean distance),
+        # which cannot be packed into IntHeap's integer keys; they run
+        # through the tuple-keyed heapq loop instead.
+        if self.heuristic is not AStar.manhattan_distance:
+            return self._search_heapq(start, goal)
+
         self.start_timer()
-        
-        # Priority queue: (f_cost, counter, cell)
-        # f(n) = g(n) + h(n)
+
+        rows, cols = self.rows, self.cols
+        n_cells = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+
+        # Bind hot attributes to locals: inside the loop these become
+        # LOAD_FAST instead of repeated attribute lookups
+        padded = self._padded
+        dirs = self.directions
+        calculate_priority = self.calculate_priority
+        record_explored = self.record_explored
+        record_frontier_add = self.record_frontier_add
+        record_frontier_remove = self.record_frontier_remove
+
+        # For the default setup (A* priority + Manhattan heuristic) the
+        # heuristic is a pure function of (r, c) for a fixed goal, so it
+        # can be broadcast over the whole grid once and read back as a
+        # plain array lookup per neighbor. Custom heuristics and
+        # subclasses overriding calculate_priority (e.g. GBFS) keep the
+        # callable path.
+        h_table = None
+        if (type(self).calculate_priority is AStar.calculate_priority
+                and self.heuristic is AStar.manhattan_distance):
+            h_table = (np.abs(np.arange(rows)[:, None] - goal[0])
+                       + np.abs(np.arange(cols)[None, :] - goal[1]))
+            self._h = h_table
+
+        # Cells are packed as idx = r * cols + c so per-cell state lives
+        # in flat arrays instead of tuple-keyed dicts.
+        g_cost = np.full(n_cells, np.iinfo(np.int32).max, dtype=np.int32)
+        parent = np.full(n_cells, -1, dtype=np.int32)
+        visited = np.zeros(n_cells, dtype=bool)
+
+        # Priority queue keyed by (f_cost << 32) | counter: one integer
+        # compare per heap step, and the counter keeps FIFO order among
+        # equal f-costs (same tie-breaking as the old tuple heap).
         counter = 0
-        g_cost = {start: 0}
-        f_start = self.calculate_priority(0, start, goal)
-        frontier = [(f_start, counter, start)]
-        
-        visited = set()
-        parent = {start: None}
-        
+        g_cost[start_idx] = 0
+        parent[start_idx] = start_idx
+        f_start = calculate_priority(0, start, goal)
+        frontier = IntHeap(n_cells)
+        frontier.push((f_start << 32) | counter, start_idx)
+        record_frontier_add(start)
+
         while frontier:
-            # Record frontier BEFORE popping (cells to be explored - BLUE)
-            frontier_cells = [item[2] for item in frontier]
-            self.record_frontier(frontier_cells)
-            
             # Pop cell with lowest f-cost (will be RED)
-            _, _, (r, c) = heapq.heappop(frontier)
-            
+            idx = frontier.pop()
+            r, c = divmod(idx, cols)
+            record_frontier_remove((r, c))
+
             # Skip if already visited (may have been added with higher cost)
-            if (r, c) in visited:
+            if visited[idx]:
                 continue
-            
-            visited.add((r, c))
-            self.record_explored((r, c))
-            
+
+            visited[idx] = True
+            record_explored((r, c))
+
             # Check if goal reached
-            if (r, c) == goal:
+            if idx == goal_idx:
                 self.stop_timer()
-                path = self.reconstruct_path(parent, goal)
+                path = self._reconstruct_path_array(parent, start_idx, goal_idx)
                 return self.create_result(path, success=True)
-            
+
             # Explore neighbors
-            for dr, dc in self.directions:
+            new_g = int(g_cost[idx]) + 1  # Assuming uniform cost of 1
+
+            # Padded grid makes the bounds check implicit: off-grid
+            # neighbors hit the wall border
+            for dr, dc in dirs:
                 nr, nc = r + dr, c + dc
-                
-                if not self.in_bounds(nr, nc) or not self.is_free(nr, nc):
+
+                if padded[nr + 1, nc + 1] != 0:
                     continue
-                
-                if (nr, nc) in visited:
+
+                nidx = nr * cols + nc
+                if visited[nidx]:
                     continue
-                
-                # Calculate new g cost (cost to reach neighbor through current cell)
-                new_g = g_cost[(r, c)] + 1  # Assuming uniform cost of 1
-                
+
                 # If we found a better path to this neighbor
-                if (nr, nc) not in g_cost or new_g < g_cost[(nr, nc)]:
-                    g_cost[(nr, nc)] = new_g
-                    f_cost = self.calculate_priority(new_g, (nr, nc), goal)
-                    parent[(nr, nc)] = (r, c)
+                if new_g < g_cost[nidx]:
+                    g_cost[nidx] = new_g
+                    if h_table is not None:
+                        f_cost = new_g + int(h_table[nr, nc])
+                    else:
+                        f_cost = calculate_priority(new_g, (nr, nc), goal)
+                    parent[nidx] = idx
                     counter += 1
-                    heapq.heappush(frontier, (f_cost, counter, (nr, nc)))
-        
+                    frontier.push((f_cost << 32) | counter, nidx)
+                    record_frontier_add((nr, nc))
+
+        # No path found
+        self.stop_timer()
+        return self.create_result([], success=False)
+
+    def _search_heapq(self, start, goal):
+        """
+        A* loop with a tuple-keyed heapq frontier.
+
+        Used for non-default heuristics, whose priorities may be floats
+        and so cannot be packed into IntHeap's integer keys. Ordering
+        and tie-breaking match the integer path: lowest f-cost first,
+        FIFO among equal f-costs via the counter.
+        """
+        self.start_timer()
+
+        rows, cols = self.rows, self.cols
+        n_cells = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+
+        padded = self._padded
+        dirs = self.directions
+        calculate_priority = self.calculate_priority
+        record_explored = self.record_explored
+        record_frontier_add = self.record_frontier_add
+        record_frontier_remove = self.record_frontier_remove
+
+        g_cost = np.full(n_cells, np.iinfo(np.int32).max, dtype=np.int32)
+        parent = np.full(n_cells, -1, dtype=np.int32)
+        visited = np.zeros(n_cells, dtype=bool)
+
+        counter = 0
+        g_cost[start_idx] = 0
+        parent[start_idx] = start_idx
+        frontier = [(calculate_priority(0, start, goal), counter, start_idx)]
+        record_frontier_add(start)
+
+        while frontier:
+            # Pop cell with lowest f-cost (will be RED)
+            _, _, idx = heapq.heappop(frontier)
+            r, c = divmod(idx, cols)
+            record_frontier_remove((r, c))
+
+            # Skip if already visited (may have been added with higher cost)
+            if visited[idx]:
+                continue
+
+            visited[idx] = True
+            record_explored((r, c))
+
+            # Check if goal reached
+            if idx == goal_idx:
+                self.stop_timer()
+                path = self._reconstruct_path_array(parent, start_idx, goal_idx)
+                return self.create_result(path, success=True)
+
+            # Explore neighbors
+            new_g = int(g_cost[idx]) + 1  # Assuming uniform cost of 1
+
+            for dr, dc in dirs:
+                nr, nc = r + dr, c + dc
+
+                if padded[nr + 1, nc + 1] != 0:
+                    continue
+
+                nidx = nr * cols + nc
+                if visited[nidx]:
+                    continue
+
+                # If we found a better path to this neighbor
+                if new_g < g_cost[nidx]:
+                    g_cost[nidx] = new_g
+                    f_cost = calculate_priority(new_g, (nr, nc), goal)
+                    parent[nidx] = idx
+                    counter += 1
+                    heapq.heappush(frontier, (f_cost, counter, nidx))
+                    record_frontier_add((nr, nc))
+
         # No path found
         self.stop_timer()
         return self.create_result([], success=False)
 
+    def _search_compiled(self, start, goal):
+        """
+        Run A* through the numba kernel (no tracking).
+
+        Mirrors BFS._search_compiled: only the path comes back as
+        tuples, and the kernel's visited order is dropped so track=False
+        results match the pure-Python fallback whether or not numba is
+        installed.
+        """
+        grid = np.ascontiguousarray(self.grid, dtype=np.uint8)
+        cols = self.cols
+
+        self.start_timer()
+        parent, _, success = astar_core(grid, start[0], start[1],
+                                        goal[0], goal[1])
+        self.stop_timer()
+
+        path = []
+        if success:
+            start_idx = start[0] * cols + start[1]
+            goal_idx = goal[0] * cols + goal[1]
+            path = self._reconstruct_path_array(parent, start_idx, goal_idx)
+
+        return self.create_result(path, success=success)
+
+    def _reconstruct_path_array(self, parent, start_idx, goal_idx):
+        """Walk the flat parent array from goal back to start."""
+        cols = self.cols
+        path = []
+        idx = goal_idx
+        while idx != start_idx:
+            path.append((idx // cols, idx % cols))
+            idx = int(parent[idx])
+        path.append((start_idx // cols, start_idx % cols))
+        path.reverse()  # in place: start -> goal, no extra copy
+        return path
+
 
 # Standalone function for backward compatibility
-def astar_search(grid, start, goal, heuristic=None):
+def astar_search(grid, start, goal, heuristic=None, track=True,
+                 snapshot_mode=False):
     """
     Convenience function to run A* without creating a class instance.
-    
+
     Args:
         grid: 2D grid (0 = free, 1 = wall)
         start: Starting cell (row, col)
         goal: Goal cell (row, col)
         heuristic: Optional heuristic function
-        
+        track: Record visited order for visualization
+        snapshot_mode: Also record frontier deltas (needed to animate)
+
     Returns:
         SearchResult with path and tracking data
     """
-    searcher = AStar(grid, heuristic)
+    searcher = AStar(grid, heuristic, track=track, snapshot_mode=snapshot_mode)
     return searcher.search(start, goal)
@@ -1,6 +1,17 @@
 from collections import deque
+
+import numpy as np
+
 from .utils import TrackedGridSearch, SearchResult
 
+# The compiled kernel needs numba, which is an optional accelerator.
+# Without it we simply keep using the pure-Python loop.
+try:
+    from ._bfs_numba import bfs_core
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 
 class BFS(TrackedGridSearch):
     """
@@ -35,53 +46,110 @@ class BFS(TrackedGridSearch):
         """
         # Reset tracking for new search
         self.init_tracking()
+
+        # Fast path: when tracking is off we don't need frontier history,
+        # so the whole search can run inside the compiled kernel.
+        if not self.track and _HAS_NUMBA:
+            return self._search_compiled(start, goal)
+
         self.start_timer()
-        
-        # BFS data structures
-        queue = deque([start])
-        visited = set([start])
-        parent = {start: None}
-        
+
+        stride = self._stride
+        start_idx = self.pack(*start)
+        goal_idx = self.pack(*goal)
+
+        # Bind hot attributes to locals: inside the loop these become
+        # LOAD_FAST instead of repeated attribute lookups
+        padded = self._padded
+        dirs = self.directions
+        record_explored = self.record_explored
+        record_frontier_add = self.record_frontier_add
+        record_frontier_remove = self.record_frontier_remove
+
+        # BFS data structures, keyed by packed cell indices so set/dict
+        # operations hash a single int instead of a tuple
+        queue = deque([start_idx])
+        visited = {start_idx}
+        parent = {start_idx: -1}
+        record_frontier_add(start)
+
         while queue:
-            # Record frontier BEFORE popping (cells to be explored - BLUE)
-            self.record_frontier(queue)
-            
             # Pop and explore current cell (will be RED)
-            r, c = queue.popleft()
-            self.record_explored((r, c))
-            
+            idx = queue.popleft()
+            r, c = divmod(idx, stride)
+            record_frontier_remove((r, c))
+            record_explored((r, c))
+
             # Check if goal reached
-            if (r, c) == goal:
+            if idx == goal_idx:
                 self.stop_timer()
-                path = self.reconstruct_path(parent, goal)
+                path = self.reconstruct_path_packed(parent, goal_idx)
                 return self.create_result(path, success=True)
-            
-            # Explore neighbors
-            for dr, dc in self.directions:
+
+            # Explore neighbors (padded grid makes the bounds check
+            # implicit: off-grid neighbors hit the wall border)
+            for dr, dc in dirs:
                 nr, nc = r + dr, c + dc
-                
-                if self.is_valid_move(nr, nc, visited):
-                    visited.add((nr, nc))
-                    parent[(nr, nc)] = (r, c)
-                    queue.append((nr, nc))
+
+                if padded[nr + 1, nc + 1] == 0:
+                    nidx = idx + dr * stride + dc
+                    if nidx not in visited:
+                        visited.add(nidx)
+                        parent[nidx] = idx
+                        queue.append(nidx)
+                        record_frontier_add((nr, nc))
         
         # No path found
         self.stop_timer()
         return self.create_result([], success=False)
 
+    def _search_compiled(self, start, goal):
+        """
+        Run BFS through the numba kernel (no tracking).
+
+        The kernel works on cell indices (idx = r * cols + c); only the
+        final path is converted back to (row, col) tuples. The visited
+        order the kernel returns is deliberately dropped: track=False
+        means no tracking stats regardless of whether the compiled or
+        pure-Python path ran, so results don't depend on numba being
+        installed.
+        """
+        grid = np.ascontiguousarray(self.grid, dtype=np.uint8)
+        cols = self.cols
+
+        self.start_timer()
+        parent, _, success = bfs_core(grid, start[0], start[1],
+                                      goal[0], goal[1])
+        self.stop_timer()
+
+        path = []
+        if success:
+            idx = goal[0] * cols + goal[1]
+            start_idx = start[0] * cols + start[1]
+            while idx != start_idx:
+                path.append((idx // cols, idx % cols))
+                idx = int(parent[idx])
+            path.append(start)
+            path.reverse()
+
+        return self.create_result(path, success=success)
+
 
 # Standalone function for backward compatibility
-def bfs_search(grid, start, goal):
+def bfs_search(grid, start, goal, track=True, snapshot_mode=False):
     """
     Convenience function to run BFS without creating a class instance.
-    
+
     Args:
         grid: 2D grid (0 = free, 1 = wall)
         start: Starting cell (row, col)
         goal: Goal cell (row, col)
-        
+        track: Record visited order for visualization.
+               Pass False to enable the compiled fast path.
+        snapshot_mode: Also record frontier deltas (needed to animate)
+
     Returns:
         SearchResult with path and tracking data
     """
-    searcher = BFS(grid)
+    searcher = BFS(grid, track=track, snapshot_mode=snapshot_mode)
     return searcher.search(start, goal)
@@ -0,0 +1,166 @@
+from collections import deque
+from .utils import TrackedGridSearch, SearchResult
+
+
+class BiBFS(TrackedGridSearch):
+    """
+    ---------------------------------------------------------
+    BIDIRECTIONAL BFS (BiBFS) WITH TRACKING
+    ---------------------------------------------------------
+    Runs two breadth-first searches at once - one from the start, one
+    from the goal - and stops when the frontiers meet in the middle.
+    For long paths this explores O(2 * b^(d/2)) cells instead of BFS's
+    O(b^d), a quadratic reduction in explored area.
+
+    Each round expands the smaller of the two frontiers by one full
+    level, which keeps the explored regions balanced.
+
+    Inherits from TrackedGridSearch which provides:
+    - Grid navigation utilities (in_bounds, is_free, etc.)
+    - Tracking for visualization (visited_order, frontier deltas)
+    - Execution time measurement
+
+    Visualization colors:
+    - GREEN: Start cell
+    - YELLOW: Goal cell
+    - RED: Explored cells (from both directions)
+    - BLUE: Frontier (to be explored)
+    - GREY: Final path
+    """
+
+    def search(self, start, goal):
+        """
+        Perform bidirectional BFS from start and goal simultaneously.
+
+        Args:
+            start: Starting cell (row, col)
+            goal: Goal cell (row, col)
+
+        Returns:
+            SearchResult containing path, visited order, frontier deltas, etc.
+        """
+        # Reset tracking for new search
+        self.init_tracking()
+        self.start_timer()
+
+        start_idx = self.pack(*start)
+        goal_idx = self.pack(*goal)
+
+        if start_idx == goal_idx:
+            self.stop_timer()
+            return self.create_result([start], success=True)
+
+        # One queue and parent dict per direction, keyed by packed cell
+        # indices (-1 marks the respective root)
+        queue_f = deque([start_idx])
+        queue_b = deque([goal_idx])
+        parent_f = {start_idx: -1}
+        parent_b = {goal_idx: -1}
+        self.record_frontier_add(start)
+        self.record_frontier_add(goal)
+
+        meet = -1
+        while queue_f and queue_b:
+            # Expand the smaller frontier by one full level
+            if len(queue_f) <= len(queue_b):
+                meet = self._expand_level(queue_f, parent_f, parent_b)
+            else:
+                meet = self._expand_level(queue_b, parent_b, parent_f)
+
+            if meet != -1:
+                break
+
+        self.stop_timer()
+
+        if meet == -1:
+            # Frontiers never met: no path exists
+            return self.create_result([], success=False)
+
+        path = self._stitch_path(parent_f, parent_b, meet)
+        return self.create_result(path, success=True)
+
+    def _expand_level(self, queue, parent, other_parent):
+        """
+        Expand one BFS level of the given direction.
+
+        Args:
+            queue: Frontier queue for this direction
+            parent: Parent dict for this direction
+            other_parent: Parent dict of the opposite direction
+
+        Returns:
+            Packed index of the meeting cell, or -1 if the frontiers
+            have not met yet.
+        """
+        stride = self._stride
+        padded = self._padded
+        dirs = self.directions
+        record_explored = self.record_explored
+        record_frontier_add = self.record_frontier_add
+        record_frontier_remove = self.record_frontier_remove
+
+        for _ in range(len(queue)):
+            # Pop and explore current cell (will be RED)
+            idx = queue.popleft()
+            r, c = divmod(idx, stride)
+            record_frontier_remove((r, c))
+            record_explored((r, c))
+
+            # Meet-in-the-middle: the other search already reached here
+            if idx in other_parent:
+                return idx
+
+            # Explore neighbors (padded grid makes bounds implicit)
+            for dr, dc in dirs:
+                nr, nc = r + dr, c + dc
+
+                if padded[nr + 1, nc + 1] == 0:
+                    nidx = idx + dr * stride + dc
+                    if nidx not in parent:
+                        parent[nidx] = idx
+                        queue.append(nidx)
+                        record_frontier_add((nr, nc))
+
+        return -1
+
+    def _stitch_path(self, parent_f, parent_b, meet):
+        """
+        Join the two half-paths at the meeting cell.
+
+        Walks meet -> start through the forward parents (then reverses)
+        and meet -> goal through the backward parents.
+        """
+        stride = self._stride
+
+        path = []
+        idx = meet
+        while idx != -1:
+            path.append(divmod(idx, stride))
+            idx = parent_f[idx]
+        path.reverse()  # start -> meet
+
+        idx = parent_b[meet]
+        while idx != -1:
+            path.append(divmod(idx, stride))
+            idx = parent_b[idx]  # meet -> goal
+
+        return path
+
+
+# Standalone function for backward compatibility
+def bibfs_search(grid, start, goal, track=True, snapshot_mode=False):
+    """
+    Convenience function to run BiBFS without creating a class instance.
+
+    Args:
+        grid: 2D grid (0 = free, 1 = wall)
+        start: Starting cell (row, col)
+        goal: Goal cell (row, col)
+        track: Record visited order for visualization
+        snapshot_mode: Also record frontier deltas (needed to animate)
+
+    Returns:
+        SearchResult with path and tracking data
+    """
+    searcher = BiBFS(grid, track=track, snapshot_mode=snapshot_mode)
+    return searcher.search(start, goal)
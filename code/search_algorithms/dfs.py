@@ -38,33 +38,50 @@ class DFS(TrackedGridSearch):
         self.init_tracking()
         self.start_timer()
         
-        # DFS data structures (using stack instead of queue)
-        stack = [start]
-        visited = set([start])
-        parent = {start: None}
-        
+        stride = self._stride
+        start_idx = self.pack(*start)
+        goal_idx = self.pack(*goal)
+
+        # Bind hot attributes to locals: inside the loop these become
+        # LOAD_FAST instead of repeated attribute lookups
+        padded = self._padded
+        dirs_rev = self.directions_rev
+        record_explored = self.record_explored
+        record_frontier_add = self.record_frontier_add
+        record_frontier_remove = self.record_frontier_remove
+
+        # DFS data structures (using stack instead of queue), keyed by
+        # packed cell indices so set/dict operations hash a single int
+        stack = [start_idx]
+        visited = {start_idx}
+        parent = {start_idx: -1}
+        record_frontier_add(start)
+
         while stack:
-            # Record frontier/stack BEFORE popping (cells to be explored - BLUE)
-            self.record_frontier(stack)
-            
             # Pop and explore current cell (will be RED)
-            r, c = stack.pop()
-            self.record_explored((r, c))
-            
+            idx = stack.pop()
+            r, c = divmod(idx, stride)
+            record_frontier_remove((r, c))
+            record_explored((r, c))
+
             # Check if goal reached
-            if (r, c) == goal:
+            if idx == goal_idx:
                 self.stop_timer()
-                path = self.reconstruct_path(parent, goal)
+                path = self.reconstruct_path_packed(parent, goal_idx)
                 return self.create_result(path, success=True)
-            
-            # Explore neighbors (reversed to maintain left-to-right order)
-            for dr, dc in reversed(self.directions):
+
+            # Explore neighbors (reversed to maintain left-to-right
+            # order; padded grid makes the bounds check implicit)
+            for dr, dc in dirs_rev:
                 nr, nc = r + dr, c + dc
-                
-                if self.is_valid_move(nr, nc, visited):
-                    visited.add((nr, nc))
-                    parent[(nr, nc)] = (r, c)
-                    stack.append((nr, nc))
+
+                if padded[nr + 1, nc + 1] == 0:
+                    nidx = idx + dr * stride + dc
+                    if nidx not in visited:
+                        visited.add(nidx)
+                        parent[nidx] = idx
+                        stack.append(nidx)
+                        record_frontier_add((nr, nc))
         
         # No path found
         self.stop_timer()
@@ -72,17 +89,19 @@ class DFS(TrackedGridSearch):
 
 
 # Standalone function for backward compatibility
-def dfs_search(grid, start, goal):
+def dfs_search(grid, start, goal, track=True, snapshot_mode=False):
     """
     Convenience function to run DFS without creating a class instance.
-    
+
     Args:
         grid: 2D grid (0 = free, 1 = wall)
         start: Starting cell (row, col)
         goal: Goal cell (row, col)
-        
+        track: Record visited order for visualization
+        snapshot_mode: Also record frontier deltas (needed to animate)
+
     Returns:
         SearchResult with path and tracking data
     """
-    searcher = DFS(grid)
+    searcher = DFS(grid, track=track, snapshot_mode=snapshot_mode)
     return searcher.search(start, goal)
@@ -33,18 +33,21 @@ class GBFS(AStar):
 
 
 # Standalone function for backward compatibility
-def gbfs_search(grid, start, goal, heuristic=None):
+def gbfs_search(grid, start, goal, heuristic=None, track=True,
+                snapshot_mode=False):
     """
     Convenience function to run GBFS without creating a class instance.
-    
+
     Args:
         grid: 2D grid (0 = free, 1 = wall)
         start: Starting cell (row, col)
         goal: Goal cell (row, col)
         heuristic: Optional heuristic function
-        
+        track: Record visited order for visualization
+        snapshot_mode: Also record frontier deltas (needed to animate)
+
     Returns:
         SearchResult with path and tracking data
     """
-    searcher = GBFS(grid, heuristic)
+    searcher = GBFS(grid, heuristic, track=track, snapshot_mode=snapshot_mode)
     return searcher.search(start, goal)
@@ -1,10 +1,18 @@
 """
 Maze Generator - generates random solvable mazes.
-Uses BFS to validate paths.
+Uses connected-component labeling to validate paths.
 """
 
 import numpy as np
-from .bfs import bfs_search
+from scipy import ndimage
+
+# 4-connectivity (no diagonals), matching the movement rules in
+# GridSearchBase.directions.
+_CONNECTIVITY = np.array([
+    [0, 1, 0],
+    [1, 1, 1],
+    [0, 1, 0]
+])
 
 
 # Fallback maze (10x15, known solvable)
@@ -19,46 +27,68 @@ FALLBACK_MAZE = np.array([
     [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0],
     [0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0],
     [0, 1, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-])
+], dtype=np.uint8)
 
 
 def has_valid_path(grid, start, goal):
-    """Check if path exists using BFS."""
-    return bfs_search(grid, start, goal).success
+    """
+    Check if a path exists between start and goal.
+
+    A path exists exactly when both cells are free and belong to the
+    same connected component of free cells, which ndimage.label
+    computes in a single C pass - no need to actually run a search.
+    """
+    labels, _ = ndimage.label(grid == 0, structure=_CONNECTIVITY)
+    return labels[start] != 0 and labels[start] == labels[goal]
 
 
-def generate_maze(rows, cols, start=None, goal=None, wall_prob=0.3):
+def generate_maze(rows, cols, start=None, goal=None, wall_prob=0.3,
+                  rng=None):
     """
     Generate a random solvable maze.
-    
+
     Args:
         rows, cols: Maze dimensions
         start: Start cell, defaults to (0, 0)
         goal: Goal cell, defaults to (rows-1, cols-1)
         wall_prob: Wall probability (0.0-1.0)
-    
+        rng: Optional np.random.Generator (for seeded, reproducible
+             mazes); a fresh generator is created when omitted
+
     Returns:
-        numpy array (0=free, 1=wall)
+        numpy uint8 array (0=free, 1=wall)
     """
     start = start or (0, 0)
     goal = goal or (rows - 1, cols - 1)
-    
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Reusable buffers: each attempt samples and thresholds in place
+    # instead of allocating two fresh arrays per retry. uint8 keeps the
+    # grid 8x smaller than the default int64 and is cheaper to compare
+    # against 0/1 in the search inner loops.
+    buf = np.empty((rows, cols), dtype=np.float64)
+    grid = np.empty((rows, cols), dtype=np.uint8)
+
     for attempt in range(100):
-        grid = (np.random.random((rows, cols)) < wall_prob).astype(int)
+        rng.random(out=buf)
+        np.less(buf, wall_prob, out=grid, casting='unsafe')
         grid[start[0], start[1]] = 0
         grid[goal[0], goal[1]] = 0
-        
+
         if has_valid_path(grid, start, goal):
             print(f"Maze generated after {attempt + 1} attempt(s)")
             return grid
-    
+
     # Fallback
     print("Using fallback maze...")
     if rows == 10 and cols == 15:
         return FALLBACK_MAZE.copy()
-    
+
     # Create L-shaped path
-    grid = (np.random.random((rows, cols)) < wall_prob).astype(int)
+    rng.random(out=buf)
+    np.less(buf, wall_prob, out=grid, casting='unsafe')
     grid[start[0], start[1]] = 0
     grid[goal[0], goal[1]] = 0
     for i in range(rows):
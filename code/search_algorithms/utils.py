@@ -1,25 +1,189 @@
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field
 import time
 
+import numpy as np
+
 
 @dataclass
 class SearchResult:
     """
     Data class to store all results from a search algorithm.
     Used for visualization and analysis.
+
+    The frontier is stored as a delta log (frontier_added /
+    frontier_removed, lists of (step, cell) pairs) rather than one
+    snapshot per step; call build_frontier_history() to materialize
+    the per-step snapshots when they are actually needed.
+
+    Tracking fields are None when the corresponding tracking mode was
+    disabled for the search; explored_count and path_length are always
+    filled in by create_result.
     """
     path: list = field(default_factory=list)
-    visited_order: list = field(default_factory=list)
-    frontier_history: list = field(default_factory=list)
+    visited_order: list | None = None
+    frontier_added: list | None = None
+    frontier_removed: list | None = None
+    frontier_history: list | None = None
     explored_count: int = 0
     path_length: int = 0
     execution_time: float = 0.0
     success: bool = False
-    
-    def __post_init__(self):
-        self.explored_count = len(self.visited_order)
-        self.path_length = len(self.path)
+
+    def build_frontier_history(self):
+        """
+        Materialize per-step frontier snapshots from the delta log.
+
+        Snapshot s is the frontier just before the s-th cell was
+        explored: all cells added at steps <= s minus all cells removed
+        at steps < s. The result is cached in frontier_history, so the
+        O(steps * frontier) cost is only paid when visualization asks
+        for it.
+
+        Returns:
+            List of cell lists, one per explored step.
+        """
+        if self.frontier_history or not self.frontier_added:
+            return self.frontier_history or []
+
+        added = self.frontier_added
+        removed = self.frontier_removed
+        counts = Counter()
+        history = []
+        ai = ri = 0
+
+        for step in range(len(self.visited_order)):
+            while ai < len(added) and added[ai][0] <= step:
+                counts[added[ai][1]] += 1
+                ai += 1
+            while ri < len(removed) and removed[ri][0] < step:
+                cell = removed[ri][1]
+                counts[cell] -= 1
+                if counts[cell] == 0:
+                    del counts[cell]
+                ri += 1
+            history.append([cell for cell, k in counts.items()
+                            for _ in range(k)])
+
+        self.frontier_history = history
+        return history
+
+
+class IntHeap:
+    """
+    ---------------------------------------------------------
+    ARRAY-BACKED BINARY MIN-HEAP WITH INTEGER KEYS
+    ---------------------------------------------------------
+    Replacement for heapq + (priority, counter, cell) tuples in the
+    best-first searches. Priorities are packed into a single int64 key
+    (e.g. (f_cost << 32) | counter) and payloads are int32 cell indices,
+    so a heap operation is integer compares and array stores - no tuple
+    allocation or element-wise tuple comparison per push/pop.
+    """
+
+    def __init__(self, capacity):
+        self._keys = np.empty(max(capacity, 1), dtype=np.int64)
+        self._vals = np.empty(max(capacity, 1), dtype=np.int32)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        """Double capacity (duplicate pushes can exceed the cell count)."""
+        self._keys = np.concatenate([self._keys, np.empty_like(self._keys)])
+        self._vals = np.concatenate([self._vals, np.empty_like(self._vals)])
+
+    def push(self, key, val):
+        """Insert (key, val), sifting up to restore the heap property."""
+        if self.size == len(self._keys):
+            self._grow()
+        keys = self._keys
+        vals = self._vals
+
+        pos = self.size
+        self.size = pos + 1
+        while pos > 0:
+            par = (pos - 1) >> 1
+            if keys[par] <= key:
+                break
+            keys[pos] = keys[par]
+            vals[pos] = vals[par]
+            pos = par
+        keys[pos] = key
+        vals[pos] = val
+
+    def pop(self):
+        """
+        Remove and return the value with the smallest key.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self.size == 0:
+            raise IndexError("pop from empty IntHeap")
+        keys = self._keys
+        vals = self._vals
+        top = int(vals[0])
+
+        self.size -= 1
+        size = self.size
+        if size > 0:
+            key = keys[size]
+            val = vals[size]
+            # Sift the last element down from the root
+            pos = 0
+            child = 1
+            while child < size:
+                if child + 1 < size and keys[child + 1] < keys[child]:
+                    child += 1
+                if keys[child] >= key:
+                    break
+                keys[pos] = keys[child]
+                vals[pos] = vals[child]
+                pos = child
+                child = 2 * pos + 1
+            keys[pos] = key
+            vals[pos] = val
+        return top
+
+
+def _noop(cell):
+    """Replacement for the record_* hooks when tracking is disabled."""
+
+
+# Padded grids memoized per grid object. run_all_algorithms builds one
+# searcher per algorithm on the same grid, so without this the border
+# padding would be recomputed five times per run. Entries keep a strong
+# reference to the grid, which also guards against id() reuse.
+_PADDED_CACHE = {}
+_PADDED_CACHE_SIZE = 8
+
+
+def _padded_grid(grid):
+    """
+    Return (and cache) the wall-bordered uint8 copy of a grid.
+
+    Args:
+        grid: 2D array-like (0 = free, 1 = wall)
+
+    Returns:
+        (rows + 2, cols + 2) uint8 array with a one-cell wall ring.
+    """
+    key = id(grid)
+    cached = _PADDED_CACHE.get(key)
+    if cached is not None and cached[0] is grid:
+        return cached[1]
+
+    rows = len(grid)
+    cols = len(grid[0])
+    padded = np.ones((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid
+
+    if len(_PADDED_CACHE) >= _PADDED_CACHE_SIZE:
+        _PADDED_CACHE.pop(next(iter(_PADDED_CACHE)))
+    _PADDED_CACHE[key] = (grid, padded)
+    return padded
 
 
 class TrackingMixin:
@@ -29,26 +193,44 @@ class TrackingMixin:
     -----------------------------------------------------
     Provides tracking functionality for:
     - visited_order: cells in the order they were explored (RED)
-    - frontier_history: frontier state at each step (BLUE)
+    - frontier_added / frontier_removed: frontier delta log (BLUE)
     - execution time measurement
-    
+
+    The frontier is tracked as O(1) push/pop deltas instead of a full
+    snapshot per step; snapshots are rebuilt on demand by
+    SearchResult.build_frontier_history() (or reconstruct_frontier_at).
+
     Use this mixin with GridSearchBase to enable animation support.
-    
+
     Colors in visualization:
     - GREEN: Start cell
-    - YELLOW: Goal cell  
+    - YELLOW: Goal cell
     - RED: Explored/visited cells
     - BLUE: Frontier cells (to be explored)
     - GREY: Final path
     """
-    
+
     def init_tracking(self):
         """Initialize tracking data structures."""
         self.visited_order = []
-        self.frontier_history = []
+        self.frontier_added = []
+        self.frontier_removed = []
         self._start_time = 0.0
         self._end_time = 0.0
-    
+
+        # With tracking off, the hooks become no-ops so the search loops
+        # pay nothing for instrumentation. With tracking on but snapshot
+        # mode off (the default), only the visited order is recorded -
+        # frontier deltas exist purely for animations, which the caller
+        # requests explicitly (main.py ties this to SAVE_ANIMATIONS).
+        if not getattr(self, 'track', True):
+            self.record_explored = _noop
+            self.record_frontier_add = _noop
+            self.record_frontier_remove = _noop
+        elif not getattr(self, '_snapshot_mode', False):
+            self.record_frontier_add = _noop
+            self.record_frontier_remove = _noop
+
     def start_timer(self):
         """Start execution timer."""
         self._start_time = time.perf_counter()
@@ -64,31 +246,58 @@ class TrackingMixin:
     def record_explored(self, cell):
         """Record a cell as explored (will be shown in RED)."""
         self.visited_order.append(cell)
-    
-    def record_frontier(self, frontier):
+
+    def record_frontier_add(self, cell):
+        """Record a cell being pushed onto the frontier (BLUE)."""
+        self.frontier_added.append((len(self.visited_order), cell))
+
+    def record_frontier_remove(self, cell):
+        """Record a cell being popped off the frontier."""
+        self.frontier_removed.append((len(self.visited_order), cell))
+
+    def reconstruct_frontier_at(self, step):
         """
-        Record the current state of the frontier (will be shown in BLUE).
-        
+        Replay the delta log to get the frontier at a given step.
+
         Args:
-            frontier: List of cells
+            step: Explored-cell index (0 = before the first pop)
+
+        Returns:
+            List of cells that were on the frontier at that step
         """
-        self.frontier_history.append(list(frontier))
-    
+        counts = Counter()
+        for s, cell in self.frontier_added:
+            if s > step:
+                break
+            counts[cell] += 1
+        for s, cell in self.frontier_removed:
+            if s >= step:
+                break
+            counts[cell] -= 1
+        return [cell for cell, k in counts.items() if k > 0
+                for _ in range(k)]
+
     def create_result(self, path, success=True):
         """
         Create a SearchResult object with all tracking data.
-        
+
         Args:
             path: The final path from start to goal
             success: Whether the search found a path
-            
+
         Returns:
             SearchResult with all tracking information
         """
+        # Empty tracking data collapses to the None sentinel instead of
+        # allocating fresh empty lists per result
         return SearchResult(
             path=path,
-            visited_order=self.visited_order.copy(),
-            frontier_history=[f.copy() for f in self.frontier_history],
+            visited_order=self.visited_order.copy()
+                          if self.visited_order else None,
+            frontier_added=self.frontier_added.copy()
+                           if self.frontier_added else None,
+            frontier_removed=self.frontier_removed.copy()
+                             if self.frontier_removed else None,
             explored_count=len(self.visited_order),
             path_length=len(path),
             execution_time=self.get_execution_time(),
@@ -113,6 +322,15 @@ class GridSearchBase:
         self.rows = len(grid)
         self.cols = len(grid[0])
 
+        # Row stride for packed cell indices (see pack/unpack)
+        self._stride = self.cols
+
+        # Grid padded with a one-cell wall border: indexing at
+        # (r + 1, c + 1) makes the bounds check implicit, because any
+        # out-of-range neighbor lands on the wall ring. Memoized so
+        # several searchers over the same grid share one copy.
+        self._padded = _padded_grid(grid)
+
         # 4-direction movement (no diagonals)
         self.directions = [
             (0, 1),   # right
@@ -121,19 +339,46 @@ class GridSearchBase:
             (-1, 0)   # up
         ]
 
+        # Precomputed reversal for DFS, which pushes neighbors in
+        # reverse so they pop in left-to-right order (avoids building a
+        # reverse iterator every loop iteration)
+        self.directions_rev = tuple(reversed(self.directions))
+
+    def pack(self, r, c):
+        """
+        Pack (r, c) into a single int index (r * cols + c).
+
+        The search loops key visited/parent structures by packed ints
+        rather than (r, c) tuples: hashing one int is much cheaper than
+        hashing a tuple, and no tuple is allocated per lookup.
+        """
+        return r * self._stride + c
+
+    def unpack(self, idx):
+        """Inverse of pack: recover (r, c) from a packed index."""
+        return divmod(idx, self._stride)
+
     def in_bounds(self, r, c):
         """Check that (r, c) is inside the grid."""
         return 0 <= r < self.rows and 0 <= c < self.cols
 
     def is_free(self, r, c):
-        """Check that the cell is not a wall (0 = free, 1 = wall)."""
+        """
+        Check that the cell is not a wall (0 = free, 1 = wall).
+
+        Grids are expected to be small-int arrays (maze.py generates
+        np.uint8); any array-like with 0/1 values works.
+        """
         return self.grid[r][c] == 0
     
     def is_valid_move(self, r, c, visited):
-        """Check if a move to (r, c) is valid."""
-        return (self.in_bounds(r, c) and 
-                self.is_free(r, c) and 
-                (r, c) not in visited)
+        """
+        Check if a move to (r, c) is valid.
+
+        Uses the padded grid, so bounds and wall checks collapse into a
+        single array read.
+        """
+        return self._padded[r + 1, c + 1] == 0 and (r, c) not in visited
 
     def reconstruct_path(self, parent, goal):
         """
@@ -147,14 +392,38 @@ class GridSearchBase:
             path.append(cur)
             cur = parent[cur]
 
-        return path[::-1]  # reverse to get start → goal
-    
+        path.reverse()  # in place: start → goal, no extra copy
+        return path
+
+    def reconstruct_path_packed(self, parent, goal_idx):
+        """
+        Reconstruct a path from a parent dict keyed by packed indices.
+
+        Args:
+            parent: Dict mapping packed index -> packed parent index,
+                    with -1 marking the start cell
+            goal_idx: Packed index of the goal
+
+        Returns:
+            List of (r, c) tuples from start to goal.
+        """
+        stride = self._stride
+        path = []
+        idx = goal_idx
+
+        while idx != -1:
+            path.append(divmod(idx, stride))
+            idx = parent[idx]
+
+        path.reverse()  # in place: start → goal, no extra copy
+        return path
+
     def get_neighbors(self, r, c):
         """Get all valid neighboring cells."""
         neighbors = []
         for dr, dc in self.directions:
             nr, nc = r + dr, c + dc
-            if self.in_bounds(nr, nc) and self.is_free(nr, nc):
+            if self._padded[nr + 1, nc + 1] == 0:
                 neighbors.append((nr, nc))
         return neighbors
 
@@ -177,6 +446,12 @@ class TrackedGridSearch(GridSearchBase, TrackingMixin):
                 return self.create_result(path)
     """
     
-    def __init__(self, grid):
+    def __init__(self, grid, track=True, snapshot_mode=False):
         GridSearchBase.__init__(self, grid)
+        # When tracking is off, algorithms may dispatch to compiled
+        # kernels that skip visited/frontier recording entirely.
+        # snapshot_mode additionally enables the frontier delta log
+        # needed to animate a search; plain runs skip it.
+        self.track = track
+        self._snapshot_mode = snapshot_mode
         self.init_tracking()
@@ -0,0 +1,97 @@
+"""
+Numba-compiled animation frame precomputation.
+
+Turns the search's frontier delta log into CSR-packed paint operations:
+for every exploration frame, which flat cell indices change and which
+palette code they change to. The animator's frame callback then reduces
+to one fancy-indexed write per frame, with all filtering and ordering
+done here in a single compiled pass (mirroring the optional-kernel
+pattern of search_algorithms._bfs_numba).
+
+This module is only imported when numba is installed; the animator
+falls back to an equivalent pure-Python packing pass otherwise.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def precompute_frames(visited, adds_step, adds_cell, rem_step, rem_cell,
+                      visit_step, sg, n_frames,
+                      free_code, explored_code, frontier_code):
+    """
+    Pack per-frame paint operations from the frontier delta log.
+
+    Args:
+        visited: Flat cell index explored at each step, (n_frames,) int32
+        adds_step, adds_cell: Frontier-add log (step, flat cell index)
+        rem_step, rem_cell: Frontier-remove log (step, flat cell index)
+        visit_step: Flat per-cell step of exploration (n_frames = never)
+        sg: Flat bool mask of the start/goal cells (never repainted)
+        n_frames: Number of exploration frames
+        free_code, explored_code, frontier_code: Palette codes to emit
+
+    Returns:
+        (cells, codes, offsets): frame f paints cells[offsets[f]:
+        offsets[f+1]] with the parallel palette codes, in removal ->
+        explored -> frontier order (an add may legitimately repaint a
+        cell removed on the same frame).
+
+    Filtering matches the animator's rules: a removal logged at step s
+    is applied at frame s + 1, adds are visible at their own step, and
+    cells already explored by then - or start/goal - keep their color.
+    """
+    n_rem = np.zeros(n_frames, dtype=np.int32)
+    n_vis = np.zeros(n_frames, dtype=np.int32)
+    n_add = np.zeros(n_frames, dtype=np.int32)
+
+    for i in range(rem_step.shape[0]):
+        s = rem_step[i]
+        if s + 1 < n_frames and not sg[rem_cell[i]] and visit_step[rem_cell[i]] > s:
+            n_rem[s + 1] += 1
+    for f in range(n_frames):
+        if not sg[visited[f]]:
+            n_vis[f] += 1
+    for i in range(adds_step.shape[0]):
+        s = adds_step[i]
+        if s < n_frames and not sg[adds_cell[i]] and visit_step[adds_cell[i]] > s:
+            n_add[s] += 1
+
+    offsets = np.empty(n_frames + 1, dtype=np.int32)
+    offsets[0] = 0
+    for f in range(n_frames):
+        offsets[f + 1] = offsets[f] + n_rem[f] + n_vis[f] + n_add[f]
+
+    total = offsets[n_frames]
+    cells = np.empty(total, dtype=np.int32)
+    codes = np.empty(total, dtype=np.uint8)
+
+    # Class-wise write cursors keep each frame's ops in
+    # removal/explored/add order without sorting
+    cur_rem = offsets[:n_frames].copy()
+    cur_vis = cur_rem + n_rem
+    cur_add = cur_vis + n_vis
+
+    for i in range(rem_step.shape[0]):
+        s = rem_step[i]
+        if s + 1 < n_frames and not sg[rem_cell[i]] and visit_step[rem_cell[i]] > s:
+            pos = cur_rem[s + 1]
+            cells[pos] = rem_cell[i]
+            codes[pos] = free_code
+            cur_rem[s + 1] = pos + 1
+    for f in range(n_frames):
+        if not sg[visited[f]]:
+            pos = cur_vis[f]
+            cells[pos] = visited[f]
+            codes[pos] = explored_code
+            cur_vis[f] = pos + 1
+    for i in range(adds_step.shape[0]):
+        s = adds_step[i]
+        if s < n_frames and not sg[adds_cell[i]] and visit_step[adds_cell[i]] > s:
+            pos = cur_add[s]
+            cells[pos] = adds_cell[i]
+            codes[pos] = frontier_code
+            cur_add[s] = pos + 1
+
+    return cells, codes, offsets
@@ -0,0 +1,108 @@
+"""
+Shared grid rendering for the static and animated visualizers.
+
+Both draw_grid and animate_search show the same thing - a maze as a
+colored grid with S/G labels on a configured axis - so the palette,
+the code-grid builder, and the imshow-based axis renderer live here
+once. The whole maze is a single AxesImage: cells are integer codes
+mapped through an RGB palette, which replaces the rows*cols Rectangle
+patches the per-axis draw loop used to create.
+"""
+
+import numpy as np
+from .colors import RGBA_COLOR_MAP
+
+# Axis ticks are capped: one tick per cell is unreadable on large
+# mazes and every tick is a Line2D+Text artist matplotlib must draw
+_MAX_TICKS = 20
+
+# Integer cell codes indexing into the RGB palette below
+_FREE, _WALL, _START, _GOAL, _EXPLORED, _FRONTIER, _PATH = range(7)
+_PALETTE = np.array(
+    [np.multiply(RGBA_COLOR_MAP[name][:3], 255) for name in
+     ('free', 'wall', 'start', 'goal', 'explored', 'frontier', 'path')],
+    dtype=np.uint8)
+
+
+def _cells_to_index(cells, start, goal):
+    """Convert a cell list (minus start/goal) to fancy-index arrays."""
+    kept = [cell for cell in cells if cell != start and cell != goal]
+    if not kept:
+        return None
+    idx = np.array(kept, dtype=np.intp)
+    return idx[:, 0], idx[:, 1]
+
+
+def _grid_codes(grid, start, goal, explored=None, path=None):
+    """
+    Build the palette-code grid for a maze.
+
+    Walls and free cells come straight from the grid (0=free, 1=wall
+    matches the palette codes); explored and path cells are overlaid
+    with fancy indexing; start and goal always keep their own codes.
+
+    Returns:
+        (rows, cols) uint8 array of palette codes
+    """
+    codes = grid.astype(np.uint8)
+
+    if explored:
+        index = _cells_to_index(explored, start, goal)
+        if index is not None:
+            codes[index] = _EXPLORED
+
+    if path:
+        index = _cells_to_index(path, start, goal)
+        if index is not None:
+            codes[index] = _PATH
+
+    codes[start] = _START
+    codes[goal] = _GOAL
+    return codes
+
+
+def _render_grid_to_axis(ax, grid, start, goal, explored=None, path=None,
+                         title=None, image=None, label_fontsize=12,
+                         grid_linewidth=0.5):
+    """
+    Render a maze onto an axis as one image and configure the axis.
+
+    Args:
+        ax: Matplotlib axis to draw on
+        grid: 2D numpy array (0=free, 1=wall)
+        start: Start cell (row, col)
+        goal: Goal cell (row, col)
+        explored: Optional list of explored cells to overlay
+        path: Optional list of path cells to overlay
+        title: Optional axis title
+        image: Optional prebuilt (rows, cols, 3) uint8 buffer to show
+            instead of building one from the grid - the animator passes
+            its persistent frame buffer here
+        label_fontsize: Font size for the S/G labels
+        grid_linewidth: Line width of the cell grid overlay
+
+    Returns:
+        The AxesImage, so callers can update its data per frame
+    """
+    rows, cols = grid.shape
+
+    if image is None:
+        image = _PALETTE[_grid_codes(grid, start, goal, explored, path)]
+    im = ax.imshow(image, origin='upper', interpolation='nearest',
+                   extent=(0, cols, 0, rows))
+
+    # Start (GREEN) and goal (YELLOW) labels - always visible
+    for (r, c), label in ((start, 'S'), (goal, 'G')):
+        ax.text(c + 0.5, rows - 1 - r + 0.5, label,
+               ha='center', va='center', fontsize=label_fontsize,
+               fontweight='bold')
+
+    ax.set_xlim(0, cols)
+    ax.set_ylim(0, rows)
+    ax.set_aspect('equal')
+    if title is not None:
+        ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_xticks(range(0, cols + 1, max(1, cols // _MAX_TICKS)))
+    ax.set_yticks(range(0, rows + 1, max(1, rows // _MAX_TICKS)))
+    ax.grid(True, linewidth=grid_linewidth, color='gray', alpha=0.3)
+    return im
@@ -11,20 +11,76 @@ Colors:
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
 from matplotlib.animation import FuncAnimation
-from .colors import HEX_COLOR_MAP
+from PIL import Image, ImageDraw
+from ._render import (_FREE, _WALL, _START, _GOAL, _EXPLORED, _FRONTIER,
+                      _PATH, _PALETTE, _grid_codes, _render_grid_to_axis)
+
+# The frame-precompute kernel needs numba, which is an optional
+# accelerator; without it the pure-Python packing pass below is used.
+try:
+    from ._frames_numba import precompute_frames
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Exploration frames are downsampled past this count so GIF size and
+# encode time stop scaling with maze area
+_MAX_RENDER_FRAMES = 300
+
+# The title's step counter is refreshed once per this many exploration
+# frames: set_text invalidates the text layout and forces a
+# font-metrics pass, which adds up at animation frame rates
+_TITLE_UPDATE_EVERY = 10
+
+# Fixed GIF palette: the seven drawing colors plus a grayscale ramp to
+# catch antialiased text and grid-line pixels. Quantizing against this
+# skips Pillow's per-frame median-cut pass when encoding.
+_GIF_GRAYS = np.linspace(0, 255, 25).astype(np.uint8)
+_GIF_PALETTE = np.concatenate(
+    [_PALETTE, np.stack([_GIF_GRAYS] * 3, axis=1)]).flatten().tolist()
+
+
+def _precompute_frames_py(visited, adds_step, adds_cell, rem_step, rem_cell,
+                          visit_step, sg, n_frames,
+                          free_code, explored_code, frontier_code):
+    """Pure-Python fallback for _frames_numba.precompute_frames."""
+    rem_at = [[] for _ in range(n_frames)]
+    add_at = [[] for _ in range(n_frames)]
+    for s, cell in zip(rem_step.tolist(), rem_cell.tolist()):
+        if s + 1 < n_frames and not sg[cell] and visit_step[cell] > s:
+            rem_at[s + 1].append(cell)
+    for s, cell in zip(adds_step.tolist(), adds_cell.tolist()):
+        if s < n_frames and not sg[cell] and visit_step[cell] > s:
+            add_at[s].append(cell)
+
+    cells = []
+    codes = []
+    offsets = np.empty(n_frames + 1, dtype=np.int32)
+    offsets[0] = 0
+    for f in range(n_frames):
+        cells.extend(rem_at[f])
+        codes.extend([free_code] * len(rem_at[f]))
+        v = visited[f]
+        if not sg[v]:
+            cells.append(v)
+            codes.append(explored_code)
+        cells.extend(add_at[f])
+        codes.extend([frontier_code] * len(add_at[f]))
+        offsets[f + 1] = len(cells)
+    return (np.array(cells, dtype=np.int32),
+            np.array(codes, dtype=np.uint8), offsets)
 
 
 class SearchAnimator:
     """
     Creates step-by-step animations of search algorithms.
     """
-    
+
     def __init__(self, grid, start, goal, result, algorithm_name="Search"):
         """
         Initialize animator.
-        
+
         Args:
             grid: 2D numpy array (0=free, 1=wall)
             start: Start cell (row, col)
@@ -38,149 +94,311 @@ class SearchAnimator:
         self.goal = goal
         self.result = result
         self.algorithm_name = algorithm_name
-        
-        # Cell rectangles for animation updates
-        self.cell_patches = {}
-        
+
+        # The whole maze is one RGB image: frames recolor cells by
+        # writing into this buffer instead of mutating rows*cols
+        # Rectangle patches (patch handling is far slower in modern
+        # matplotlib than a single AxesImage update)
+        self.color_buf = np.empty((self.rows, self.cols, 3), dtype=np.uint8)
+        self._base_buf = None
+        self.im = None
+
     def _setup_base_grid(self, ax):
-        """Draw the initial grid with walls and free cells."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r, c] == 1:
-                    color = HEX_COLOR_MAP['wall']
-                else:
-                    color = HEX_COLOR_MAP['free']
-                
-                rect = Rectangle((c, self.rows - 1 - r), 1, 1,
-                                facecolor=color, edgecolor='gray', 
-                                linewidth=0.5)
-                ax.add_patch(rect)
-                self.cell_patches[(r, c)] = rect
-        
-        # Draw start (GREEN) - always visible
-        r, c = self.start
-        self.cell_patches[(r, c)].set_facecolor(HEX_COLOR_MAP['start'])
-        ax.text(c + 0.5, self.rows - 1 - r + 0.5, 'S',
-               ha='center', va='center', fontsize=10, fontweight='bold')
-        
-        # Draw goal (YELLOW) - always visible
-        r, c = self.goal
-        self.cell_patches[(r, c)].set_facecolor(HEX_COLOR_MAP['goal'])
-        ax.text(c + 0.5, self.rows - 1 - r + 0.5, 'G',
-               ha='center', va='center', fontsize=10, fontweight='bold')
-        
-        ax.set_xlim(0, self.cols)
-        ax.set_ylim(0, self.rows)
-        ax.set_aspect('equal')
-        ax.set_xticks(range(self.cols + 1))
-        ax.set_yticks(range(self.rows + 1))
-        ax.grid(True, linewidth=0.3, color='gray', alpha=0.3)
-        
-    def create_animation(self, interval=100, figsize=(10, 8)):
+        """Draw the initial grid as a single image plus S/G labels."""
+        # The static background (walls, free cells, start, goal) is
+        # rendered once and kept; building another animation from the
+        # same animator restores it with a single buffer copy
+        if self._base_buf is None:
+            self._base_buf = _PALETTE[
+                _grid_codes(self.grid, self.start, self.goal)]
+        np.copyto(self.color_buf, self._base_buf)
+
+        self.im = _render_grid_to_axis(
+            ax, self.grid, self.start, self.goal, image=self.color_buf,
+            label_fontsize=10, grid_linewidth=0.3)
+
+
+    def _pack_frame_ops(self):
         """
-        Create a step-by-step animation of the search.
-        
-        Args:
-            interval: Time between frames in milliseconds
-            figsize: Figure size tuple
-            
+        Pack the result's tracking data into per-frame paint ops.
+
+        The frontier delta log is turned into CSR-style operations:
+        exploration frame f recolors cells[offsets[f]:offsets[f+1]]
+        (flat indices) to the parallel palette codes, so frame
+        rendering is a single fancy-indexed write and no
+        O(steps * frontier) snapshot list is ever materialized.
+        Filtering rules live in the packing pass: an add at step s is
+        visible at frame s, a removal at step s is applied at frame
+        s + 1, and cells explored by then - or start/goal - keep their
+        color. With numba installed the pass runs compiled.
+
+        Long searches are downsampled: `stride` exploration steps land
+        on each rendered frame, capping the frame count; the ops for a
+        step window are contiguous, so a strided frame is still one
+        write.
+
         Returns:
-            FuncAnimation object
+            (frame_cells, frame_codes, frame_offsets, explored_repaint,
+             path_flat, path_keep, n_explore_frames, n_path_frames,
+             stride, n_explore_rendered)
         """
-        fig, ax = plt.subplots(figsize=figsize)
-        self._setup_base_grid(ax)
-        
-        title = ax.set_title(f"{self.algorithm_name} - Step 0", 
-                            fontsize=14, fontweight='bold')
-        
-        visited_order = self.result.visited_order
-        frontier_history = self.result.frontier_history
+        visited_order = self.result.visited_order or []
         path = self.result.path
-        
-        # Calculate total frames: exploration + path drawing
+
         n_explore_frames = len(visited_order)
         n_path_frames = len(path) if self.result.success else 0
-        total_frames = n_explore_frames + n_path_frames + 10  # +10 for pause at end
-        
-        # Track explored cells across frames
-        explored_so_far = set()
-        
+        stride = max(1, n_explore_frames // _MAX_RENDER_FRAMES)
+        n_explore_rendered = -(-n_explore_frames // stride)
+
+        cols = self.cols
+        visited_flat = np.array(
+            [r * cols + c for r, c in visited_order], dtype=np.int32)
+        adds = self.result.frontier_added or []
+        rems = self.result.frontier_removed or []
+        adds_step = np.array([s for s, _ in adds], dtype=np.int32)
+        adds_cell = np.array(
+            [r * cols + c for _, (r, c) in adds], dtype=np.int32)
+        rem_step = np.array([s for s, _ in rems], dtype=np.int32)
+        rem_cell = np.array(
+            [r * cols + c for _, (r, c) in rems], dtype=np.int32)
+
+        # Grid-shaped lookups: membership is an array load, no tuple
+        # hashing
+        visit_step = np.full(self.rows * cols, n_explore_frames,
+                             dtype=np.int32)
+        visit_step[visited_flat] = np.arange(n_explore_frames,
+                                             dtype=np.int32)
+        sg_flat = np.zeros(self.rows * cols, dtype=bool)
+        sg_flat[self.start[0] * cols + self.start[1]] = True
+        sg_flat[self.goal[0] * cols + self.goal[1]] = True
+
+        packer = precompute_frames if _HAS_NUMBA else _precompute_frames_py
+        frame_cells, frame_codes, frame_offsets = packer(
+            visited_flat, adds_step, adds_cell, rem_step, rem_cell,
+            visit_step, sg_flat, n_explore_frames,
+            _FREE, _EXPLORED, _FRONTIER)
+
+        # The path phase works on packed indices too: one vectorized
+        # repaint of the explored cells on its first frame, then one
+        # flat write per path cell
+        explored_repaint = visited_flat[~sg_flat[visited_flat]]
+        path_flat = np.array(
+            [r * cols + c for r, c in path], dtype=np.int32)
+        path_keep = ~sg_flat[path_flat]
+
+        return (frame_cells, frame_codes, frame_offsets, explored_repaint,
+                path_flat, path_keep, n_explore_frames, n_path_frames,
+                stride, n_explore_rendered)
+
+    def _build_animation(self, figsize):
+        """
+        Set up the figure and per-frame callback shared by interactive
+        playback and matplotlib-rendered GIF saving.
+
+        Returns:
+            (fig, update, title, total_frames)
+        """
+        fig, ax = plt.subplots(figsize=figsize)
+        self._setup_base_grid(ax)
+
+        title = ax.set_title(f"{self.algorithm_name} - Step 0",
+                            fontsize=14, fontweight='bold')
+
+        (frame_cells, frame_codes, frame_offsets, explored_repaint,
+         path_flat, path_keep, n_explore_frames, n_path_frames,
+         stride, n_explore_rendered) = self._pack_frame_ops()
+        total_frames = n_explore_rendered + n_path_frames + 1
+
+        color_buf = self.color_buf
+        buf_flat = color_buf.reshape(-1, 3)
+
+        # Hoist per-frame lookups out of the callback: attribute,
+        # method, and module-global loads become plain closure loads
+        set_data = self.im.set_data
+        set_text = title.set_text
+        name = self.algorithm_name
+        palette = _PALETTE
+        pal_explored = _PALETTE[_EXPLORED]
+        pal_path = _PALETTE[_PATH]
+        # Only these two artists change per frame; with blit=True
+        # everything else comes from the cached background
+        artists = [self.im, title]
+
+        # Cache the title string so unchanged frames skip set_text and
+        # its layout invalidation entirely
+        last_title = [None]
+
+        def set_title(text):
+            if text != last_title[0]:
+                set_text(text)
+                last_title[0] = text
+
         def update(frame):
-            if frame < n_explore_frames:
-                # Exploration phase
-                step = frame
-                
-                # Reset previous frontier cells to free/explored
-                if step > 0 and step - 1 < len(frontier_history):
-                    for cell in frontier_history[step - 1]:
-                        if cell not in explored_so_far and cell != self.start and cell != self.goal:
-                            if self.grid[cell[0], cell[1]] == 0:
-                                self.cell_patches[cell].set_facecolor(HEX_COLOR_MAP['free'])
-                
-                # Mark current explored cell (RED)
-                if step < len(visited_order):
-                    cell = visited_order[step]
-                    explored_so_far.add(cell)
-                    if cell != self.start and cell != self.goal:
-                        self.cell_patches[cell].set_facecolor(HEX_COLOR_MAP['explored'])
-                
-                # Mark current frontier (BLUE)
-                if step < len(frontier_history):
-                    for cell in frontier_history[step]:
-                        if cell not in explored_so_far and cell != self.start and cell != self.goal:
-                            if self.grid[cell[0], cell[1]] == 0:
-                                self.cell_patches[cell].set_facecolor(HEX_COLOR_MAP['frontier'])
-                
-                title.set_text(f"{self.algorithm_name} - Exploring: Step {step + 1}/{n_explore_frames}")
-                
-            elif frame < n_explore_frames + n_path_frames:
+            if frame < n_explore_rendered:
+                # Exploration phase: apply this frame's window of
+                # paint ops
+                step_end = min((frame + 1) * stride, n_explore_frames)
+                lo = frame_offsets[frame * stride]
+                hi = frame_offsets[step_end]
+                buf_flat[frame_cells[lo:hi]] = palette[frame_codes[lo:hi]]
+
+                # Step counter is only refreshed periodically and on
+                # the last exploration frame
+                if (frame % _TITLE_UPDATE_EVERY == 0
+                        or frame == n_explore_rendered - 1):
+                    set_title(f"{name} - Exploring: Step {step_end}/{n_explore_frames}")
+
+            elif frame < n_explore_rendered + n_path_frames:
                 # Path drawing phase
-                path_step = frame - n_explore_frames
-                
-                # Clear frontier colors first (only on first path frame)
+                path_step = frame - n_explore_rendered
+
+                # Repaint explored cells first (only on first path frame)
                 if path_step == 0:
-                    for cell in explored_so_far:
-                        if cell != self.start and cell != self.goal:
-                            self.cell_patches[cell].set_facecolor(HEX_COLOR_MAP['explored'])
-                
-                # Draw path cells (GREY)
-                for i in range(path_step + 1):
-                    cell = path[i]
-                    if cell != self.start and cell != self.goal:
-                        self.cell_patches[cell].set_facecolor(HEX_COLOR_MAP['path'])
-                
-                title.set_text(f"{self.algorithm_name} - Drawing Path: {path_step + 1}/{n_path_frames}")
-                
+                    buf_flat[explored_repaint] = pal_explored
+
+                # Draw the newest path cell (GREY) - earlier ones keep
+                # their color in the persistent buffer
+                if path_keep[path_step]:
+                    buf_flat[path_flat[path_step]] = pal_path
+
+                if (path_step % _TITLE_UPDATE_EVERY == 0
+                        or path_step == n_path_frames - 1):
+                    set_title(f"{name} - Drawing Path: {path_step + 1}/{n_path_frames}")
+
             else:
                 # Final state - show complete result
-                stats = f"Path: {len(path)}, Explored: {len(visited_order)}"
-                title.set_text(f"{self.algorithm_name} - Complete! {stats}")
-            
-            return list(self.cell_patches.values())
-        
+                stats = f"Path: {len(path_flat)}, Explored: {n_explore_frames}"
+                set_title(f"{name} - Complete! {stats}")
+
+            set_data(color_buf)
+            return artists
+
+        return fig, update, title, total_frames
+
+    def create_animation(self, interval=100, figsize=(10, 8)):
+        """
+        Create a step-by-step animation of the search.
+
+        Args:
+            interval: Time between frames in milliseconds
+            figsize: Figure size tuple
+
+        Returns:
+            FuncAnimation object
+        """
+        fig, update, title, total_frames = self._build_animation(figsize)
+
+        # animated=True keeps the title out of the static background so
+        # blitting can redraw it per frame
+        title.set_animated(True)
         anim = FuncAnimation(fig, update, frames=total_frames,
-                           interval=interval, blit=False, repeat=False)
-        
+                           interval=interval, blit=True, repeat=False)
+
         return anim, fig
-    
+
     def save_animation(self, filename, interval=100, figsize=(10, 8), dpi=100):
         """
         Save animation to a GIF file.
-        
+
         Args:
             filename: Output filename (should end in .gif)
             interval: Time between frames in milliseconds
             figsize: Figure size tuple
             dpi: Resolution
         """
-        anim, fig = self.create_animation(interval, figsize)
-        
-        # Save as GIF
+        fig, update, _, total_frames = self._build_animation(figsize)
+        fig.set_dpi(dpi)
+
         print(f"Saving animation to {filename}...")
-        anim.save(filename, writer='pillow', fps=1000//interval, dpi=dpi)
+
+        # Drive the frame callback directly and grab the canvas buffer
+        # ourselves: one figure and one renderer are reused for every
+        # frame, with no FuncAnimation/writer machinery per frame
+        canvas = fig.canvas
+        pal_img = Image.new('P', (1, 1))
+        pal_img.putpalette(_GIF_PALETTE)
+        frames = []
+        for frame in range(total_frames):
+            update(frame)
+            canvas.draw()
+            # convert() copies out of the shared canvas buffer before
+            # the next draw overwrites it; quantizing against the fixed
+            # palette hands the encoder ready-made indices
+            frames.append(Image.frombuffer(
+                'RGBA', canvas.get_width_height(),
+                canvas.buffer_rgba()).convert('RGB').quantize(
+                    palette=pal_img, dither=Image.Dither.NONE))
+
+        frames[0].save(filename, save_all=True, append_images=frames[1:],
+                       duration=interval, loop=0, optimize=True)
         plt.close(fig)
         print(f"Saved: {filename}")
 
+    def save_as_gif(self, filename, cell_pixels=20, interval=100):
+        """
+        Save the animation to a GIF by rendering frames directly with
+        PIL, bypassing matplotlib entirely.
+
+        The GIF content is a colored grid plus the S/G labels, so each
+        frame is just the palette-code grid upsampled to `cell_pixels`
+        square blocks and wrapped in a paletted image - no figure, no
+        Agg canvas, no RGB quantization. Axes and title styling are
+        only available through the matplotlib-backed save_animation.
+
+        Args:
+            filename: Output filename (should end in .gif)
+            cell_pixels: Rendered size of one maze cell in pixels
+            interval: Time between frames in milliseconds
+        """
+        (frame_cells, frame_codes, frame_offsets, explored_repaint,
+         path_flat, path_keep, n_explore_frames, n_path_frames,
+         stride, n_explore_rendered) = self._pack_frame_ops()
+
+        print(f"Saving animation to {filename}...")
+
+        # Cell codes double as GIF palette indices, so a frame is one
+        # fancy-indexed write into this flat grid plus a block upsample
+        codes = self.grid.astype(np.uint8).reshape(-1)
+        codes[self.start[0] * self.cols + self.start[1]] = _START
+        codes[self.goal[0] * self.cols + self.goal[1]] = _GOAL
+
+        half = cell_pixels // 2
+
+        def render():
+            up = codes.reshape(self.rows, self.cols)
+            up = up.repeat(cell_pixels, axis=0).repeat(cell_pixels, axis=1)
+            img = Image.fromarray(up, mode='P')
+            img.putpalette(_GIF_PALETTE)
+            draw = ImageDraw.Draw(img)
+            for (r, c), label in ((self.start, 'S'), (self.goal, 'G')):
+                # Offsets center PIL's 6x11 built-in bitmap font
+                draw.text((c * cell_pixels + half - 3,
+                           r * cell_pixels + half - 5),
+                          label, fill=_WALL)
+            return img
+
+        frames = []
+        for frame in range(n_explore_rendered):
+            step_end = min((frame + 1) * stride, n_explore_frames)
+            lo = frame_offsets[frame * stride]
+            hi = frame_offsets[step_end]
+            codes[frame_cells[lo:hi]] = frame_codes[lo:hi]
+            frames.append(render())
+
+        for path_step in range(n_path_frames):
+            if path_step == 0:
+                codes[explored_repaint] = _EXPLORED
+            if path_keep[path_step]:
+                codes[path_flat[path_step]] = _PATH
+            frames.append(render())
+
+        # Terminal frame mirrors the matplotlib renderers' final state
+        frames.append(render())
+
+        frames[0].save(filename, save_all=True, append_images=frames[1:],
+                       duration=interval, loop=0, optimize=True)
+        print(f"Saved: {filename}")
+
 
 def animate_search(grid, start, goal, result, algorithm_name="Search",
                    filename=None, interval=100, figsize=(10, 8)):
@@ -203,7 +421,9 @@ def animate_search(grid, start, goal, result, algorithm_name="Search",
     animator = SearchAnimator(grid, start, goal, result, algorithm_name)
     
     if filename:
-        animator.save_animation(filename, interval, figsize)
+        # GIF output never touches matplotlib: frames go straight to
+        # paletted PIL images
+        animator.save_as_gif(filename, interval=interval)
         return None
     else:
         anim, fig = animator.create_animation(interval, figsize)
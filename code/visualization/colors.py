@@ -11,6 +11,8 @@ Color scheme:
 - BLACK: Wall cells
 """
 
+from matplotlib.colors import to_rgba
+
 # RGB tuples (0-1 range for matplotlib)
 GREEN = (0.2, 0.8, 0.2)      # Start
 YELLOW = (1.0, 0.9, 0.2)     # Goal
@@ -49,3 +51,8 @@ HEX_COLOR_MAP = {
     'free': HEX_WHITE,
     'wall': HEX_BLACK
 }
+
+# Hex colors resolved through matplotlib's parser once, at import time,
+# so drawing code never re-parses color strings per cell or per frame
+RGBA_COLOR_MAP = {name: to_rgba(value)
+                  for name, value in HEX_COLOR_MAP.items()}